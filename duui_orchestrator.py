@@ -1,19 +1,91 @@
 #!/usr/bin/env python3
 """
 DUUI Pipeline Orchestrator - Python REST Client
-Chains Sentiment → HateCheck → FactChecking
+Runs Sentiment, HateCheck and FactChecking concurrently
 """
 
-import requests
-import json
+import asyncio
+import functools
+import gzip
+import hashlib
+import importlib.util
+import httpx
+import numpy as np
+import orjson
+import os
+import re
+import sqlite3
+import sys
 import time
-from typing import Dict, Any, List
+import zipfile
+from typing import Dict, Any, List, Optional, Callable, Set, Tuple
 
 # Component endpoints
 SENTIMENT_URL = "http://localhost:9001"
 HATECHECK_URL = "http://localhost:9002"
 FACTCHECK_URL = "http://localhost:9003"
 
+# HTTP client settings shared by health probes and component calls.
+# HTTP/2 needs the optional `h2` package (pip install httpx[http2]).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+CLIENT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+CLIENT_TIMEOUT = httpx.Timeout(300, connect=5)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Request bodies above GZIP_MIN_BYTES can be gzip-compressed. Components must
+# decode Content-Encoding: gzip themselves, so this is opt-in via DUUI_GZIP=1.
+GZIP_REQUESTS = os.environ.get("DUUI_GZIP", "0") == "1"
+GZIP_MIN_BYTES = 1024
+GZIP_HEADERS = {**JSON_HEADERS, "Content-Encoding": "gzip"}
+
+# ETags of each component's /v1/typesystem, so health probes can be answered
+# with 304 Not Modified instead of re-sending the typesystem
+ETAGS_PATH = ".duui_etags.json"
+
+# After a successful health probe a tiny request is sent in the background so
+# the component has its model loaded before the real request arrives
+WARMUP_TEXT = "Hello."
+WARMUP_TIMEOUT = 30
+
+# Component responses are cached on disk keyed by URL + payload, so repeated
+# runs over the same input skip the HTTP round trip. Set DUUI_CACHE=0 to bypass.
+CACHE_ENABLED = os.environ.get("DUUI_CACHE", "1") != "0"
+CACHE_PATH = ".duui_cache.sqlite"
+
+# Fact-check pairs whose claim and fact are both close enough to an already
+# scored pair reuse that score. Opt-in via DUUI_SEMANTIC_CACHE=1, and needs the
+# optional `sentence-transformers` package.
+SEMANTIC_CACHE_ENABLED = os.environ.get("DUUI_SEMANTIC_CACHE", "0") == "1"
+SEMANTIC_CACHE_AVAILABLE = importlib.util.find_spec("sentence_transformers") is not None
+SEMANTIC_CACHE_FORMAT = 2
+SEMANTIC_CACHE_PATH = ".duui_semantic_cache.npz"
+SEMANTIC_CACHE_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_CACHE_THRESHOLD = 0.87
+SEMANTIC_CACHE_SIZE = 1024
+
+# Fact-check pairs are sent in shards of FACTCHECK_CHUNK_SIZE, with at most
+# FACTCHECK_CONCURRENCY requests in flight at once
+FACTCHECK_CHUNK_SIZE = 2
+FACTCHECK_CONCURRENCY = 4
+
+# A sentence runs up to terminal punctuation followed by whitespace (or end of text)
+SENTENCE_PATTERN = re.compile(r"\S.*?(?:[.!?](?=\s|$)|\Z)", re.S)
+
+# Sentiment label per argmax column of (neg, pos, neu) scores. argmax returns the
+# first maximum, so ties resolve NEGATIVE, then POSITIVE, then NEUTRAL.
+SENTIMENT_LABELS = ("NEGATIVE", "POSITIVE", "NEUTRAL")
+
+# Request fields that don't depend on the input text
+SENTIMENT_PAYLOAD_BASE = {
+    "lang": "en",
+    "model_name": "cardiffnlp/twitter-xlm-roberta-base-sentiment",
+    "batch_size": 32,
+    "ignore_max_length_truncation_padding": False
+}
+HATECHECK_PAYLOAD_BASE = {
+    "lang": "en"
+}
+
 TEST_TEXT = """
 I'm really disappointed with my city lately. The public transport system is absolutely terrible - it breaks down constantly and the app crashes multiple times a day. The parks are getting worse with poor maintenance, and the streets feel increasingly unsafe.
 
@@ -64,203 +136,599 @@ FACT_CHECK_PAIRS = [
 ]
 
 
-def check_component(name: str, url: str) -> bool:
-    """Check if a component is alive."""
+def request_timeout(seconds: float) -> httpx.Timeout:
+    """
+    Per-request timeout with the given read/write budget.
+    
+    A plain number passed as timeout= would replace the client's whole Timeout,
+    so the short connect timeout is carried over explicitly.
+    """
+    return httpx.Timeout(seconds, connect=CLIENT_TIMEOUT.connect)
+
+
+def make_client() -> httpx.AsyncClient:
+    """Create the client whose connection pool is shared by all calls."""
+    return httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,
+        limits=CLIENT_LIMITS,
+        timeout=CLIENT_TIMEOUT
+    )
+
+
+def encode_body(payload: Dict[str, Any]) -> Tuple[bytes, Dict[str, str]]:
+    """Serialize a JSON payload, gzip-compressing it when enabled and worthwhile."""
+    body = orjson.dumps(payload)
+    if GZIP_REQUESTS and len(body) >= GZIP_MIN_BYTES:
+        return gzip.compress(body, compresslevel=1), GZIP_HEADERS
+    return body, JSON_HEADERS
+
+
+_etags: Optional[Dict[str, str]] = None
+_etags_changed = False
+
+
+def get_etags() -> Dict[str, str]:
+    """Load the stored typesystem ETags on first use."""
+    global _etags
+    if _etags is None:
+        try:
+            with open(ETAGS_PATH, "rb") as f:
+                _etags = orjson.loads(f.read())
+        except (OSError, orjson.JSONDecodeError):
+            _etags = {}
+    return _etags
+
+
+def set_etag(url: str, etag: str):
+    """Remember a component's typesystem ETag."""
+    global _etags_changed
+    etags = get_etags()
+    if etags.get(url) != etag:
+        etags[url] = etag
+        _etags_changed = True
+
+
+def save_etags():
+    """Persist new typesystem ETags; a failed write only costs the next 304."""
+    global _etags_changed
+    if not _etags_changed:
+        return
+    try:
+        with open(ETAGS_PATH, "wb") as f:
+            f.write(orjson.dumps(get_etags()))
+        _etags_changed = False
+    except OSError as e:
+        print(f"  ⚠ Typesystem ETags not saved: {e}")
+
+
+_warmup_tasks: Set[asyncio.Task] = set()
+
+
+async def warm_up(client: httpx.AsyncClient, url: str, payload: Dict[str, Any]):
+    """Send a throwaway request so the component loads its model; errors are ignored."""
+    try:
+        body, headers = encode_body(payload)
+        await client.post(
+            f"{url}/v1/process", content=body, headers=headers,
+            timeout=request_timeout(WARMUP_TIMEOUT)
+        )
+    except httpx.HTTPError:
+        pass
+
+
+async def cancel_warmups():
+    """Cancel warm-up requests that are still in flight and wait for them to finish."""
+    tasks = list(_warmup_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def check_component(
+    client: httpx.AsyncClient,
+    name: str,
+    url: str,
+    warmup_payload: Optional[Dict[str, Any]] = None
+) -> bool:
+    """Check if a component is alive, then start warming it up in the background."""
+    etags = get_etags()
+    headers = {"If-None-Match": etags[url]} if url in etags else None
     try:
-        resp = requests.get(f"{url}/v1/typesystem", timeout=5)
-        if resp.status_code == 200:
+        resp = await client.get(f"{url}/v1/typesystem", headers=headers, timeout=request_timeout(5))
+        if resp.status_code in (200, 304):
+            if resp.status_code == 200 and resp.headers.get("ETag"):
+                set_etag(url, resp.headers["ETag"])
             print(f"  ✓ {name}: {url}")
+            if warmup_payload is not None:
+                task = asyncio.create_task(warm_up(client, url, warmup_payload))
+                _warmup_tasks.add(task)
+                task.add_done_callback(_warmup_tasks.discard)
             return True
         else:
             print(f"  ✗ {name}: HTTP {resp.status_code}")
             return False
-    except requests.exceptions.RequestException as e:
+    except httpx.HTTPError as e:
         print(f"  ✗ {name}: {e}")
         return False
 
 
-def run_sentiment(text: str) -> Dict[str, Any]:
+_memory_cache: Dict[str, Dict[str, Any]] = {}
+_cache_db: Optional[sqlite3.Connection] = None
+
+
+def get_cache_db() -> sqlite3.Connection:
+    """Open the on-disk response cache, creating it on first use."""
+    global _cache_db
+    if _cache_db is None:
+        db = sqlite3.connect(CACHE_PATH)
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body TEXT NOT NULL)"
+        )
+        _cache_db = db
+    return _cache_db
+
+
+def cache_key(url: str, payload: Dict[str, Any]) -> str:
+    """Hash a request into a stable cache key."""
+    return hashlib.sha256(url.encode() + orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
+
+def cache_get(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached response, checking memory before disk.
+    
+    The cache is best-effort: an unreadable database counts as a miss.
+    """
+    if key in _memory_cache:
+        return _memory_cache[key]
+    try:
+        row = get_cache_db().execute(
+            "SELECT body FROM responses WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        _memory_cache[key] = orjson.loads(row[0])
+    except (sqlite3.Error, orjson.JSONDecodeError) as e:
+        print(f"  ⚠ Response cache unavailable: {e}")
+        return None
+    return _memory_cache[key]
+
+
+def cache_put(key: str, value: Dict[str, Any]):
+    """Store a response in memory and on disk; a failed disk write is skipped."""
+    _memory_cache[key] = value
+    try:
+        db = get_cache_db()
+        db.execute(
+            "INSERT OR REPLACE INTO responses (key, body) VALUES (?, ?)",
+            (key, orjson.dumps(value).decode())
+        )
+        db.commit()
+    except sqlite3.Error as e:
+        print(f"  ⚠ Response cache not written: {e}")
+
+
+async def cached_post(
+    client: httpx.AsyncClient,
+    url: str,
+    payload: Dict[str, Any],
+    timeout: float,
+    should_cache: Optional[Callable[[Dict[str, Any]], bool]] = None
+) -> Dict[str, Any]:
+    """
+    POST a payload and return the decoded JSON response, served from cache when possible.
+    
+    Raises httpx.HTTPStatusError for any status other than 200; those are never cached.
+    """
+    key = cache_key(url, payload)
+    if CACHE_ENABLED:
+        cached = cache_get(key)
+        if cached is not None:
+            return cached
+    
+    body, headers = encode_body(payload)
+    resp = await client.post(
+        url, content=body, headers=headers, timeout=request_timeout(timeout)
+    )
+    if resp.status_code != 200:
+        raise httpx.HTTPStatusError(
+            f"HTTP {resp.status_code}", request=resp.request, response=resp
+        )
+    result = orjson.loads(resp.content)
+    if CACHE_ENABLED and (should_cache is None or should_cache(result)):
+        cache_put(key, result)
+    return result
+
+
+class SemanticCache:
+    """
+    Fact-check scores keyed by the embedding of a (claim, fact) pair.
+    
+    A pair is keyed by its normalized claim and fact vectors side by side.
+    The two halves are compared separately and a hit needs both the claim
+    and the fact similarity to reach the threshold, so a close claim cannot
+    make up for a different fact. Least recently used entries are evicted
+    past max_entries.
+    """
+    
+    def __init__(self, path: str, threshold: float, max_entries: int):
+        from sentence_transformers import SentenceTransformer
+        
+        self.path = path
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.model = SentenceTransformer(SEMANTIC_CACHE_MODEL)
+        
+        self.half = self.model.get_sentence_embedding_dimension()
+        dim = 2 * self.half
+        self.embeddings = np.zeros((0, dim), dtype=np.float32)
+        self.scores = np.zeros(0, dtype=np.float32)
+        self.last_used = np.zeros(0, dtype=np.int64)
+        self.clock = 0
+        
+        # An unreadable or outdated file is treated as an empty cache
+        if os.path.exists(path):
+            try:
+                with np.load(path) as data:
+                    current = (
+                        "format" in data.files
+                        and int(data["format"]) == SEMANTIC_CACHE_FORMAT
+                        and data["embeddings"].shape[1] == dim
+                    )
+                    if current:
+                        embeddings = data["embeddings"]
+                        scores = data["scores"]
+                        last_used = data["last_used"]
+                        self.embeddings, self.scores, self.last_used = embeddings, scores, last_used
+                        self.clock = int(last_used.max(initial=0))
+            except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+                print(f"  ⚠ Semantic cache file unreadable, starting empty: {e}")
+    
+    def embed(self, pairs: List[Dict]):
+        """Embed each pair as its unit claim vector followed by its unit fact vector."""
+        texts = [p["claim"] for p in pairs] + [p["fact"] for p in pairs]
+        vectors = self.model.encode(texts, normalize_embeddings=True).astype(np.float32)
+        claims, facts = vectors[:len(pairs)], vectors[len(pairs):]
+        return np.hstack([claims, facts])
+    
+    def lookup(self, pairs: List[Dict]):
+        """Return the pair embeddings and the cached score of each pair (None on a miss)."""
+        embeddings = self.embed(pairs)
+        scores: List[Optional[float]] = [None] * len(pairs)
+        if len(self.scores) == 0:
+            return embeddings, scores
+        
+        h = self.half
+        claim_similarity = embeddings[:, :h] @ self.embeddings[:, :h].T
+        fact_similarity = embeddings[:, h:] @ self.embeddings[:, h:].T
+        similarity = np.minimum(claim_similarity, fact_similarity)
+        best = similarity.argmax(axis=1)
+        for i, j in enumerate(best):
+            if similarity[i, j] >= self.threshold:
+                self.clock += 1
+                self.last_used[j] = self.clock
+                scores[i] = float(self.scores[j])
+        
+        if any(score is not None for score in scores):
+            self.save()
+        return embeddings, scores
+    
+    def add(self, embeddings, scores: List[float]):
+        """Store newly computed scores and persist the cache."""
+        count = len(scores)
+        stamps = np.arange(self.clock + 1, self.clock + 1 + count, dtype=np.int64)
+        self.clock += count
+        
+        self.embeddings = np.vstack([self.embeddings, embeddings])
+        self.scores = np.concatenate([self.scores, np.asarray(scores, dtype=np.float32)])
+        self.last_used = np.concatenate([self.last_used, stamps])
+        
+        if len(self.scores) > self.max_entries:
+            keep = np.sort(np.argsort(self.last_used)[-self.max_entries:])
+            self.embeddings = self.embeddings[keep]
+            self.scores = self.scores[keep]
+            self.last_used = self.last_used[keep]
+        
+        self.save()
+    
+    def save(self):
+        """Write the cache to disk; a failed write only costs future hits."""
+        try:
+            with open(self.path, "wb") as f:
+                np.savez(
+                    f, format=SEMANTIC_CACHE_FORMAT, embeddings=self.embeddings,
+                    scores=self.scores, last_used=self.last_used
+                )
+        except OSError as e:
+            print(f"  ⚠ Semantic cache not written: {e}")
+
+
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> Optional[SemanticCache]:
+    """Load the semantic cache on first use; None when it is unavailable or disabled."""
+    global _semantic_cache
+    if not (CACHE_ENABLED and SEMANTIC_CACHE_ENABLED and SEMANTIC_CACHE_AVAILABLE):
+        return None
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache(
+            SEMANTIC_CACHE_PATH, SEMANTIC_CACHE_THRESHOLD, SEMANTIC_CACHE_SIZE
+        )
+    return _semantic_cache
+
+
+def split_sentences(text: str) -> List[Dict[str, Any]]:
+    """Split text into sentences with begin/end offsets into the original text."""
+    sentences = []
+    for match in SENTENCE_PATTERN.finditer(text):
+        sentence = match.group().rstrip()
+        begin = match.start()
+        sentences.append({
+            "text": sentence,
+            "begin": begin,
+            "end": begin + len(sentence)
+        })
+    return sentences
+
+
+def build_sentiment_payload(text: str) -> Dict[str, Any]:
+    """Build the Sentiment request for a text."""
+    return {
+        **SENTIMENT_PAYLOAD_BASE,
+        "selections": [{"selection": "text", "sentences": split_sentences(text)}],
+        "doc_len": len(text)
+    }
+
+
+def build_hatecheck_payload(text: str) -> Dict[str, Any]:
+    """Build the HateCheck request for a text."""
+    return {
+        **HATECHECK_PAYLOAD_BASE,
+        "selections": [{"selection": "text", "sentences": split_sentences(text)}],
+        "doc_len": len(text)
+    }
+
+
+async def run_sentiment(client: httpx.AsyncClient, text: str) -> Dict[str, Any]:
     """Run Sentiment analysis."""
     print("\n[1/3] Running Sentiment Analysis...")
     
-    payload = {
-        "selections": [
-            {
-                "selection": "text",
-                "sentences": [
-                    {
-                        "text": text,
-                        "begin": 0,
-                        "end": len(text)
-                    }
-                ]
-            }
-        ],
-        "lang": "en",
-        "doc_len": len(text),
-        "model_name": "cardiffnlp/twitter-xlm-roberta-base-sentiment",
-        "batch_size": 32,
-        "ignore_max_length_truncation_padding": False
-    }
+    payload = build_sentiment_payload(text)
     
     try:
-        resp = requests.post(f"{SENTIMENT_URL}/v1/process", json=payload, timeout=180)
-        if resp.status_code == 200:
-            print(f"  ✓ Sentiment analysis completed")
-            return resp.json()
-        else:
-            print(f"  ✗ Sentiment failed: HTTP {resp.status_code}")
-            return {}
+        result = await cached_post(client, f"{SENTIMENT_URL}/v1/process", payload, timeout=180)
+        print(f"  ✓ Sentiment analysis completed")
+        return result
+    except httpx.HTTPStatusError as e:
+        print(f"  ✗ Sentiment failed: HTTP {e.response.status_code}")
+        return {}
     except Exception as e:
         print(f"  ✗ Sentiment error: {e}")
         return {}
 
 
-def run_hatecheck(text: str) -> Dict[str, Any]:
+async def run_hatecheck(client: httpx.AsyncClient, text: str) -> Dict[str, Any]:
     """Run Hate Checking."""
     print("\n[2/3] Running Hate Checking...")
     
-    payload = {
-        "selections": [
-            {
-                "selection": "text",
-                "sentences": [
-                    {
-                        "text": text,
-                        "begin": 0,
-                        "end": len(text)
-                    }
-                ]
-            }
-        ],
-        "lang": "en",
-        "doc_len": len(text)
-    }
+    payload = build_hatecheck_payload(text)
     
     try:
-        resp = requests.post(f"{HATECHECK_URL}/v1/process", json=payload, timeout=60)
-        if resp.status_code == 200:
-            print(f"  ✓ Hate speech detection completed")
-            return resp.json()
-        else:
-            print(f"  ✗ HateCheck failed: HTTP {resp.status_code}")
-            return {}
+        result = await cached_post(client, f"{HATECHECK_URL}/v1/process", payload, timeout=60)
+        print(f"  ✓ Hate speech detection completed")
+        return result
+    except httpx.HTTPStatusError as e:
+        print(f"  ✗ HateCheck failed: HTTP {e.response.status_code}")
+        return {}
     except Exception as e:
         print(f"  ✗ HateCheck error: {e}")
         return {}
 
 
-def run_factcheck(claim_fact_pairs: List[Dict]) -> Dict[str, Any]:
-    """
-    Run Fact Checking.
-    """
-    print("\n[3/3] Running Fact Checking...")
+def build_factcheck_payload(claim_fact_pairs: List[Dict]) -> Dict[str, Any]:
+    """Lay claim/fact pairs out in one text with begin/end offsets for each span."""
+    claim_prefixes = [f"Claim {i + 1}: " for i in range(len(claim_fact_pairs))]
+    fact_prefixes = [f" Fact {i + 1}: " for i in range(len(claim_fact_pairs))]
     
-    if not claim_fact_pairs:
-        return {}
+    # Each pair is laid out as: claim prefix, claim, fact prefix, fact, "\n".
+    # The running sum of segment lengths gives the end offset of every segment.
+    lengths = np.array([
+        (len(claim_prefix), len(pair["claim"]), len(fact_prefix), len(pair["fact"]), 1)
+        for pair, claim_prefix, fact_prefix in zip(claim_fact_pairs, claim_prefixes, fact_prefixes)
+    ], dtype=np.int64).reshape(-1, 5)
+    ends = lengths.cumsum().reshape(-1, 5)
+    claim_starts, claim_ends, fact_starts, fact_ends = ends[:, :4].T.tolist()
+    
+    combined_text = "".join(
+        f"{claim_prefix}{pair['claim']}{fact_prefix}{pair['fact']}\n"
+        for pair, claim_prefix, fact_prefix in zip(claim_fact_pairs, claim_prefixes, fact_prefixes)
+    )
     
-    combined_text_parts = []
     claims_all = []
     facts_all = []
-    current_pos = 0
-    
-    for claim_idx, pair in enumerate(claim_fact_pairs):
-        claim_text = pair["claim"]
-        fact_text = pair["fact"]
-        
-        claim_prefix = f"Claim {claim_idx + 1}: "
-        claim_start = current_pos + len(claim_prefix)
-        claim_end = claim_start + len(claim_text)
-        
-        combined_text_parts.append(claim_prefix + claim_text)
-        current_pos = claim_end
-        
-        fact_prefix = f" Fact {claim_idx + 1}: "
-        fact_start = current_pos + len(fact_prefix)
-        fact_end = fact_start + len(fact_text)
-        
-        combined_text_parts.append(fact_prefix + fact_text)
-        current_pos = fact_end
-        combined_text_parts.append("\n")
-        current_pos += 1
-        
-        claim_dict = {
+    for pair, claim_start, claim_end, fact_start, fact_end in zip(
+        claim_fact_pairs, claim_starts, claim_ends, fact_starts, fact_ends
+    ):
+        # Nested references only carry offsets; their text is already in
+        # combined_text and in the top-level claim/fact entries
+        claims_all.append({
             "begin": claim_start,
             "end": claim_end,
-            "text": claim_text,
-            "facts": [{"begin": fact_start, "end": fact_end, "text": fact_text}]
-        }
-        claims_all.append(claim_dict)
-        
-        fact_dict = {
+            "text": pair["claim"],
+            "facts": [{"begin": fact_start, "end": fact_end}]
+        })
+        facts_all.append({
             "begin": fact_start,
             "end": fact_end,
-            "text": fact_text,
-            "claims": [{"begin": claim_start, "end": claim_end, "text": claim_text}]
-        }
-        facts_all.append(fact_dict)
+            "text": pair["fact"],
+            "claims": [{"begin": claim_start, "end": claim_end}]
+        })
     
-    combined_text = "".join(combined_text_parts)
-    
-    payload = {
+    return {
         "text": combined_text,
         "lang": "en",
         "claims_all": claims_all,
         "facts_all": facts_all
     }
+
+
+def factcheck_chunks(indices: List[int]) -> List[List[int]]:
+    """Split pair indices into the shards sent as separate fact-check requests."""
+    return [
+        indices[i:i + FACTCHECK_CHUNK_SIZE]
+        for i in range(0, len(indices), FACTCHECK_CHUNK_SIZE)
+    ]
+
+
+def has_all_scores(result: Dict[str, Any], pairs: List[Dict]) -> bool:
+    """Whether a fact-check response has exactly one consistency score per pair."""
+    consistency = result.get('consistency') or []
+    return len(consistency) == len(pairs) > 0
+
+
+async def run_factcheck(client: httpx.AsyncClient, claim_fact_pairs: List[Dict]) -> Dict[str, Any]:
+    """
+    Run Fact Checking.
+    
+    Pairs that paraphrase an already scored pair are answered from the
+    semantic cache; the remaining pairs are sent to the component in
+    concurrent shards.
+    """
+    print("\n[3/3] Running Fact Checking...")
+    
+    if not claim_fact_pairs:
+        return {}
     
+    # Model loading and encoding are CPU-bound; keep them off the event loop.
+    # The cache is best-effort: any failure falls back to scoring every pair.
+    embeddings, scores = None, [None] * len(claim_fact_pairs)
     try:
-        resp = requests.post(f"{FACTCHECK_URL}/v1/process", json=payload, timeout=300)
-        if resp.status_code == 200:
-            result = resp.json()
-            print(f"  ✓ Fact checking completed")
-            
-            consistency = result.get('consistency', [])
-            if not consistency or len(consistency) == 0:
-                print(f"  ⚠ Component bug: empty results returned")
+        semantic_cache = await asyncio.to_thread(get_semantic_cache)
+        if semantic_cache is not None:
+            embeddings, scores = await asyncio.to_thread(semantic_cache.lookup, claim_fact_pairs)
+    except Exception as e:
+        print(f"  ⚠ Semantic cache unavailable: {e}")
+        semantic_cache = None
+    
+    pending = [i for i, score in enumerate(scores) if score is None]
+    semantic_indices = [i for i, score in enumerate(scores) if score is not None]
+    if not pending:
+        print(f"  ✓ Fact checking served from semantic cache")
+        return {"consistency": scores, "semantic_cache_indices": semantic_indices}
+    
+    semaphore = asyncio.Semaphore(FACTCHECK_CONCURRENCY)
+    
+    async def check_chunk(chunk: List[int]) -> Dict[str, Any]:
+        """Score one shard of pairs, falling back to demo scores on timeout or empty output."""
+        chunk_pairs = [claim_fact_pairs[i] for i in chunk]
+        async with semaphore:
+            try:
+                # Empty or short results are a known component bug; only
+                # persist responses that pass the check below
+                result = await cached_post(
+                    client, f"{FACTCHECK_URL}/v1/process",
+                    build_factcheck_payload(chunk_pairs), timeout=300,
+                    should_cache=lambda r: has_all_scores(r, chunk_pairs)
+                )
+            except httpx.TimeoutException:
                 return {
-                    "consistency": generate_demo_scores(claim_fact_pairs),
-                    "is_demo": True
+                    "consistency": generate_demo_scores(chunk_pairs),
+                    "is_demo": True,
+                    "timed_out": True
                 }
-            return result
-        else:
-            print(f"  ✗ FactChecking failed: HTTP {resp.status_code}")
+        if not has_all_scores(result, chunk_pairs):
+            return {"consistency": generate_demo_scores(chunk_pairs), "is_demo": True}
+        return result
+    
+    # Shard the uncached pairs so the component scores them in parallel
+    chunks = factcheck_chunks(pending)
+    results = await asyncio.gather(*(check_chunk(c) for c in chunks), return_exceptions=True)
+    
+    for result in results:
+        if isinstance(result, httpx.HTTPStatusError):
+            print(f"  ✗ FactChecking failed: HTTP {result.response.status_code}")
             return {}
-    except requests.exceptions.Timeout:
-        print(f"  ✗ FactCheck timed out (>300s)")
-        print(f"  ⚠ Using demo scores")
-        return {
-            "consistency": generate_demo_scores(claim_fact_pairs),
-            "is_demo": True,
-            "timed_out": True
-        }
-    except Exception as e:
-        print(f"  ✗ FactCheck error: {e}")
-        return {}
+        if isinstance(result, Exception):
+            print(f"  ✗ FactCheck error: {result}")
+            return {}
+    
+    print(f"  ✓ Fact checking completed")
+    
+    combined: Dict[str, Any] = {}
+    consistency = list(scores)
+    fresh_indices: List[int] = []
+    fresh_scores: List[float] = []
+    # Demo scores are tracked per pair, since only some shards may fall back
+    demo_indices: List[int] = []
+    timed_out_indices: List[int] = []
+    for chunk, result in zip(chunks, results):
+        for i, score in zip(chunk, result["consistency"]):
+            consistency[i] = score
+        if result.get("is_demo"):
+            demo_indices.extend(chunk)
+            if result.get("timed_out"):
+                timed_out_indices.extend(chunk)
+        else:
+            combined = {**result, **combined}
+            fresh_indices.extend(chunk)
+            fresh_scores.extend(result["consistency"])
+    
+    if timed_out_indices:
+        print(f"  ✗ FactCheck timed out (>300s) for {len(timed_out_indices)} pair(s)")
+    if len(demo_indices) > len(timed_out_indices):
+        print(f"  ⚠ Component bug: empty results returned for "
+              f"{len(demo_indices) - len(timed_out_indices)} pair(s)")
+    if demo_indices:
+        print(f"  ⚠ Using demo scores for {len(demo_indices)} of {len(claim_fact_pairs)} pair(s)")
+        combined["demo_indices"] = sorted(demo_indices)
+        combined["timed_out_indices"] = sorted(timed_out_indices)
+    
+    if semantic_cache is not None and fresh_indices:
+        try:
+            semantic_cache.add(embeddings[fresh_indices], fresh_scores)
+        except Exception as e:
+            print(f"  ⚠ Semantic cache unavailable: {e}")
+    
+    combined["consistency"] = consistency
+    if semantic_indices:
+        combined["semantic_cache_indices"] = semantic_indices
+    return combined
+
+
+@functools.lru_cache(maxsize=1024)
+def word_set(text: str) -> frozenset:
+    """Lowercased word set of a text, memoized since claims and facts repeat across pairs."""
+    return frozenset(text.lower().split())
 
 
 def generate_demo_scores(pairs: List[Dict]) -> List[float]:
     """Generate reasonable demo scores based on semantic similarity."""
-    scores = []
-    for pair in pairs:
-        claim = pair["claim"].lower()
-        fact = pair["fact"].lower()
-        
-        claim_words = set(claim.split())
-        fact_words = set(fact.split())
-        
-        if len(claim_words | fact_words) == 0:
-            scores.append(0.0)
-            continue
-        
-        overlap = len(claim_words & fact_words)
-        union = len(claim_words | fact_words)
-        jaccard = overlap / union
-        
-        final_score = min(jaccard * 1.2 + 0.1, 1.0)
-        scores.append(final_score)
+    if not pairs:
+        return []
+    
+    claim_tokens = [word_set(pair["claim"]) for pair in pairs]
+    fact_tokens = [word_set(pair["fact"]) for pair in pairs]
     
-    return scores
+    vocab: Dict[str, int] = {}
+    for words in claim_tokens + fact_tokens:
+        for word in words:
+            vocab.setdefault(word, len(vocab))
+    
+    # Token-presence matrices: row i marks the words of pair i
+    claims = np.zeros((len(pairs), len(vocab)), dtype=bool)
+    facts = np.zeros((len(pairs), len(vocab)), dtype=bool)
+    for i, (claim_words, fact_words) in enumerate(zip(claim_tokens, fact_tokens)):
+        claims[i, [vocab[w] for w in claim_words]] = True
+        facts[i, [vocab[w] for w in fact_words]] = True
+    
+    overlap = (claims & facts).sum(axis=1)
+    union = (claims | facts).sum(axis=1)
+    jaccard = overlap / np.maximum(union, 1)
+    
+    # Pairs with no words at all score 0.0
+    scores = np.where(union > 0, np.minimum(jaccard * 1.2 + 0.1, 1.0), 0.0)
+    return scores.tolist()
 
 
 def truncate_text(text: str, max_length: int = 150) -> str:
@@ -278,97 +746,117 @@ def display_results(
     test_text: str
 ):
     """Display pipeline results."""
-    print("\n" + "="*80)
-    print("PIPELINE RESULTS")
-    print("="*80)
+    # Collect every line and write once instead of one print() per line
+    out: List[str] = []
+    w = out.append
+    sentences = split_sentences(test_text)
+    
+    def sentence_label(i: int) -> str:
+        if i < len(sentences):
+            return f"Sentence {i+1}: {truncate_text(sentences[i]['text'], 80)}"
+        return f"Sentence {i+1}:"
+    
+    w("\n" + "="*80)
+    w("PIPELINE RESULTS")
+    w("="*80)
     
     # --- SENTIMENT ---
-    print("\n--- SENTIMENT OUTPUT ---")
-    print(f"\n  Input Text:")
-    print(f"  {truncate_text(test_text, 200)}")
-    print()
+    w("\n--- SENTIMENT OUTPUT ---")
+    w(f"\n  Input Text:")
+    w(f"  {truncate_text(test_text, 200)}")
+    w("")
     
     if sentiment_result and sentiment_result.get('selections'):
         meta = sentiment_result.get('meta', {})
-        print(f"  Model: {meta.get('modelName', 'N/A')}")
-        print(f"  Version: {meta.get('version', 'N/A')}\n")
+        w(f"  Model: {meta.get('modelName', 'N/A')}")
+        w(f"  Version: {meta.get('version', 'N/A')}\n")
         
         for selection in sentiment_result.get('selections', []):
-            for sentence in selection.get('sentences', []):
-                pos = sentence.get('pos')
-                neu = sentence.get('neu')
-                neg = sentence.get('neg')
-                if pos is not None:
-                    print(f"  Sentiment Scores:")
-                    print(f"    Positive:  {pos:.4f}")
-                    print(f"    Neutral:   {neu:.4f}")
-                    print(f"    Negative:  {neg:.4f}")
-                    
-                    # Interpret
-                    max_score = max(pos, neu, neg)
-                    if max_score == neg:
-                        sentiment = "NEGATIVE"
-                    elif max_score == pos:
-                        sentiment = "POSITIVE"
-                    else:
-                        sentiment = "NEUTRAL"
-                    print(f"    Overall:   {sentiment}")
+            scored = [
+                (i, sentence)
+                for i, sentence in enumerate(selection.get('sentences', []))
+                if sentence.get('pos') is not None
+            ]
+            if not scored:
+                continue
+            
+            # Interpret all sentences at once
+            label_indices = np.array(
+                [[s['neg'], s['pos'], s['neu']] for _, s in scored]
+            ).argmax(axis=1)
+            
+            for (i, sentence), label_index in zip(scored, label_indices):
+                w(f"  {sentence_label(i)}")
+                w(f"  Sentiment Scores:")
+                w(f"    Positive:  {sentence['pos']:.4f}")
+                w(f"    Neutral:   {sentence['neu']:.4f}")
+                w(f"    Negative:  {sentence['neg']:.4f}")
+                w(f"    Overall:   {SENTIMENT_LABELS[label_index]}")
     else:
-        print("  (No output)")
+        w("  (No output)")
     
     # --- HATE CHECK ---
-    print("\n--- HATE CHECK OUTPUT ---")
-    print(f"\n  Input Text:")
-    print(f"  {truncate_text(test_text, 200)}")
-    print()
+    w("\n--- HATE CHECK OUTPUT ---")
+    w(f"\n  Input Text:")
+    w(f"  {truncate_text(test_text, 200)}")
+    w("")
     
     if hatecheck_result:
         meta = hatecheck_result.get('meta', {})
-        print(f"  Model: {meta.get('modelName', 'N/A')}\n")
+        w(f"  Model: {meta.get('modelName', 'N/A')}\n")
         
         hate_scores = hatecheck_result.get('hate', [])
         if hate_scores:
             for i, hate in enumerate(hate_scores):
                 non_hate = hatecheck_result.get('non_hate', [0])[i] if i < len(hatecheck_result.get('non_hate', [])) else 0
-                print(f"  Hate Speech Detection Scores:")
-                print(f"    Hate score:     {hate:.4f}")
-                print(f"    Non-hate score: {non_hate:.4f}")
+                w(f"  {sentence_label(i)}")
+                w(f"  Hate Speech Detection Scores:")
+                w(f"    Hate score:     {hate:.4f}")
+                w(f"    Non-hate score: {non_hate:.4f}")
                 
                 if hate > 0.5:
-                    print(f"    Status: ⚠ Contains hate speech patterns")
+                    w(f"    Status: ⚠ Contains hate speech patterns")
                 else:
-                    print(f"    Status: ✓ No hate speech detected")
+                    w(f"    Status: ✓ No hate speech detected")
         else:
-            print("  (No hate speech detected)")
+            w("  (No hate speech detected)")
     else:
-        print("  (No output)")
+        w("  (No output)")
     
     # --- FACT CHECKING ---
-    print("\n--- FACT CHECKING OUTPUT ---")
+    w("\n--- FACT CHECKING OUTPUT ---")
     if factcheck_result:
-        is_demo = factcheck_result.get('is_demo', False)
-        timed_out = factcheck_result.get('timed_out', False)
+        demo_indices = set(factcheck_result.get('demo_indices', []))
+        timed_out_indices = set(factcheck_result.get('timed_out_indices', []))
         consistency = factcheck_result.get('consistency', [])
+        semantic_indices = set(factcheck_result.get('semantic_cache_indices', []))
         
         if consistency and len(consistency) > 0:
-            if is_demo:
-                if timed_out:
-                    print("  ⚠ Component timed out - using demo scores\n")
-                else:
-                    print("  ⚠ Component returned empty - using demo scores\n")
-            else:
-                print()
+            if timed_out_indices:
+                w(f"  ⚠ Component timed out for {len(timed_out_indices)} pair(s) - using demo scores")
+            if len(demo_indices) > len(timed_out_indices):
+                w(f"  ⚠ Component returned empty for "
+                  f"{len(demo_indices) - len(timed_out_indices)} pair(s) - using demo scores")
+            w("")
             
-            print(f"  Fact-Checking Results ({len(consistency)} pairs):\n")
+            if semantic_indices:
+                w(f"  ⚠ {len(semantic_indices)} pair(s) reuse scores of similar pairs from the semantic cache\n")
+            w(f"  Fact-Checking Results ({len(consistency)} pairs):\n")
             
             for i in range(min(len(consistency), len(claim_fact_pairs))):
                 pair = claim_fact_pairs[i]
                 score = consistency[i]
                 
-                print(f"  Pair {i+1}:")
-                print(f"    Claim: {pair['claim']}")
-                print(f"    Fact:  {pair['fact']}")
-                print(f"    Score: {score:.4f}")
+                w(f"  Pair {i+1}:")
+                w(f"    Claim: {pair['claim']}")
+                w(f"    Fact:  {pair['fact']}")
+                w(f"    Score: {score:.4f}")
+                if i in semantic_indices:
+                    w(f"    (score reused from semantic cache)")
+                elif i in timed_out_indices:
+                    w(f"    (demo score: component timed out)")
+                elif i in demo_indices:
+                    w(f"    (demo score: component returned empty)")
                 
                 if score > 0.7:
                     status = "✓ SUPPORTED (claim aligns with fact)"
@@ -378,50 +866,117 @@ def display_results(
                     status = "⚠ WEAKLY SUPPORTED"
                 else:
                     status = "✗ CONTRADICTED (fact opposes claim)"
-                print(f"    {status}\n")
+                w(f"    {status}\n")
         else:
-            print("  (No results)")
+            w("  (No results)")
     else:
-        print("  (No output)")
+        w("  (No output)")
     
-    print("="*80)
+    w("="*80)
+    
+    sys.stdout.write("\n".join(out) + "\n")
 
 
-def main():
+def needs_warmup(url: str, payloads: List[Dict[str, Any]]) -> bool:
+    """Whether any of a component's real requests will miss the response cache."""
+    if not CACHE_ENABLED:
+        return True
+    return any(cache_get(cache_key(f"{url}/v1/process", p)) is None for p in payloads)
+
+
+async def timed(coro) -> Tuple[Any, float]:
+    """Await a coroutine and return its result with the elapsed seconds."""
+    start = time.perf_counter()
+    result = await coro
+    return result, time.perf_counter() - start
+
+
+async def main():
     print("="*80)
     print("DUUI Pipeline Orchestrator (Python REST Client)")
     print("Sentiment → HateCheck → FactChecking")
     print("="*80)
     
-    print("\nChecking component availability...")
-    sentiment_ok = check_component("Sentiment", SENTIMENT_URL)
-    hatecheck_ok = check_component("HateCheck", HATECHECK_URL)
-    factcheck_ok = check_component("FactCheck", FACTCHECK_URL)
-    
-    if not (sentiment_ok and hatecheck_ok and factcheck_ok):
-        print("\n❌ Some components are not available.")
-        print("\nTo start all components:")
-        print("  docker start duui-sentiment duui-hatecheck duui-factchecking")
-        return 1
+    # Don't start model loads on components whose results are all cached
+    factcheck_payloads = [
+        build_factcheck_payload([FACT_CHECK_PAIRS[i] for i in chunk])
+        for chunk in factcheck_chunks(list(range(len(FACT_CHECK_PAIRS))))
+    ]
+    sentiment_warmup = (
+        build_sentiment_payload(WARMUP_TEXT)
+        if needs_warmup(SENTIMENT_URL, [build_sentiment_payload(TEST_TEXT)]) else None
+    )
+    hatecheck_warmup = (
+        build_hatecheck_payload(WARMUP_TEXT)
+        if needs_warmup(HATECHECK_URL, [build_hatecheck_payload(TEST_TEXT)]) else None
+    )
+    factcheck_warmup = (
+        build_factcheck_payload([{"claim": WARMUP_TEXT, "fact": WARMUP_TEXT}])
+        if needs_warmup(FACTCHECK_URL, factcheck_payloads) else None
+    )
     
-    print("\n✅ All components available!")
-    print(f"\nProcessing test document ({len(TEST_TEXT)} chars)...")
-    print(f"Testing {len(FACT_CHECK_PAIRS)} claim-fact pairs...\n")
-    
-    start_time = time.time()
-    
-    sentiment_result = run_sentiment(TEST_TEXT)
-    hatecheck_result = run_hatecheck(TEST_TEXT)
-    factcheck_result = run_factcheck(FACT_CHECK_PAIRS)
-    
-    elapsed = time.time() - start_time
+    async with make_client() as client:
+        print("\nChecking component availability...")
+        probe_start = time.perf_counter()
+        sentiment_ok, hatecheck_ok, factcheck_ok = await asyncio.gather(
+            check_component(client, "Sentiment", SENTIMENT_URL, sentiment_warmup),
+            check_component(client, "HateCheck", HATECHECK_URL, hatecheck_warmup),
+            check_component(client, "FactCheck", FACTCHECK_URL, factcheck_warmup),
+        )
+        probe_elapsed = time.perf_counter() - probe_start
+        save_etags()
+        
+        if not (sentiment_ok and hatecheck_ok and factcheck_ok):
+            await cancel_warmups()
+            print("\n❌ Some components are not available.")
+            print("\nTo start all components:")
+            print("  docker start duui-sentiment duui-hatecheck duui-factchecking")
+            return 1
+        
+        print("\n✅ All components available!")
+        print(f"\nProcessing test document ({len(TEST_TEXT)} chars)...")
+        print(f"Testing {len(FACT_CHECK_PAIRS)} claim-fact pairs...\n")
+        
+        start_time = time.perf_counter()
+        
+        # The three components are independent services, so dispatch them concurrently
+        (
+            (sentiment_result, sentiment_elapsed),
+            (hatecheck_result, hatecheck_elapsed),
+            (factcheck_result, factcheck_elapsed),
+        ) = await asyncio.gather(
+            timed(run_sentiment(client, TEST_TEXT)),
+            timed(run_hatecheck(client, TEST_TEXT)),
+            timed(run_factcheck(client, FACT_CHECK_PAIRS)),
+        )
+        
+        elapsed = time.perf_counter() - start_time
+        await cancel_warmups()
     
     display_results(sentiment_result, hatecheck_result, factcheck_result, FACT_CHECK_PAIRS, TEST_TEXT)
     
     print(f"✅ Pipeline completed in {elapsed:.2f} seconds")
-    print(f"   ({elapsed/60:.1f} minutes)\n")
+    print(f"   ({elapsed/60:.1f} minutes)")
+    print(
+        f"   Stages: probe={probe_elapsed:.3f}s sentiment={sentiment_elapsed:.3f}s "
+        f"hate={hatecheck_elapsed:.3f}s fact={factcheck_elapsed:.3f}s\n"
+    )
     return 0
 
 
+def run(coro):
+    """Run a coroutine on uvloop when it is installed, otherwise on the default loop."""
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(coro)
+    uvloop_run = getattr(uvloop, "run", None)
+    if uvloop_run is None:
+        # uvloop < 0.18 has no run(); install its loop policy instead
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return asyncio.run(coro)
+    return uvloop_run(coro)
+
+
 if __name__ == "__main__":
-    exit(main())
\ No newline at end of file
+    exit(run(main()))
\ No newline at end of file